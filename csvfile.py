@@ -1,11 +1,86 @@
+import codecs
+import copy
 import csv
-from collections import Counter
+import os
+import re
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import compress, islice, repeat
+from operator import eq, ge, gt, itemgetter, le, lt, ne
 from typing import Callable, Any
 
 
+# Satu pola untuk klasifikasi tipe sel, menggantikan rantai isdigit/try float/lower.
+# Grup yang cocok (m.lastindex) menentukan konstruktor di _CASTERS.
+_DIGITS = r"\d(?:_?\d)*"
+_CAST_RE = re.compile(rf"""
+    (-?\d+)                                     # 1: int
+    | ([+-]?(?:                                 # 2: float (semua bentuk yang diterima float())
+        (?:{_DIGITS}(?:\.(?:{_DIGITS})?)?|\.{_DIGITS})(?:[eE][+-]?{_DIGITS})?
+        | (?ai:inf|infinity|nan)
+    ))
+    | ((?ai:true|false))                        # 3: bool
+""", re.VERBOSE)
+_CASTERS = (None, int, float, lambda s: s.lower() == "true")
+
+_ENCODINGS = ("utf-8", "utf-8-sig", "latin-1")
+_SNIFF_BYTES = 65536  # Ukuran sampel untuk deteksi encoding dan delimiter
+_SNIFF_LINES = 64  # Jumlah baris sampel untuk deteksi delimiter
+_STREAM_CAST_CACHE = 65536  # Batas cache cast di iter_rows agar memori tetap O(chunk)
+
+_HEADER_TRANS = str.maketrans({" ": "_", "-": "_"})  # Normalisasi header dalam satu pass
+
+# Operator filter -> fungsi (cell_value, value) -> bool
+_OP_TABLE = {
+    "==": eq,
+    "!=": ne,
+    ">": gt,
+    "<": lt,
+    ">=": ge,
+    "<=": le,
+    "in": lambda cell_value, value: cell_value in value,
+    "not in": lambda cell_value, value: cell_value not in value,
+    "contains": lambda cell_value, value: value in str(cell_value),
+    "startswith": lambda cell_value, value: str(cell_value).startswith(str(value)),
+    "endswith": lambda cell_value, value: str(cell_value).endswith(str(value)),
+}
+
+
+def _row_to_strs(row, expected_columns):
+    """Sesuaikan jumlah kolom dan convert sel ke string (None -> "") dalam satu list baru"""
+    n = len(row)
+    if n > expected_columns:
+        row = islice(row, expected_columns)
+    cells = [str(cell) if cell is not None else "" for cell in row]
+    if n < expected_columns:
+        cells.extend(repeat("", expected_columns - n))
+    return cells
+
+
+def _resolve_operator(operator):
+    if operator not in _OP_TABLE:
+        raise ValueError(f"Operator '{operator}' tidak didukung")
+    return _OP_TABLE[operator]
+
+
+def _cast_value(value: str):
+    """Cast satu sel ke int/float/bool. Tidak bergantung pada instance sehingga bisa di-cache."""
+    if value is None:
+        return None
+    v = value.strip()
+    if v == "":
+        return ""
+    m = _CAST_RE.fullmatch(v)
+    if m is None:
+        return v
+    return _CASTERS[m.lastindex](v)
+
+
 class CSVFile:
     def __init__(self, path, candidates=None, has_header=True,
-                 skip_empty=True, auto_cast=True, normalize_header=True):
+                 skip_empty=True, auto_cast=True, normalize_header=True, lazy=False):
         
         if candidates is None:
             candidates = [",", ";", "|", "\t"]  # Default delimiters
@@ -16,88 +91,173 @@ class CSVFile:
         self.skip_empty = skip_empty
         self.auto_cast = auto_cast
         self.normalize_header = normalize_header
+        self.lazy = lazy  # Jika True, hanya header yang dibaca; data hanya bisa dibaca lewat iter_rows()
 
         self.encoding = None
         self.delimiter = None
         self.header = []
+        self._indexes = {}  # {col_index: (versi_data, {nilai: [index_baris, ...]})}, lihat ensure_index()
         self.rows = []
+        self._data_version = [0]  # Dipakai bersama dengan hasil filter karena objek baris dibagi
+        self._header_idx = {}  # Cache {nama_header: index}, lihat _header_positions()
+        self._header_idx_src = None
         self._load_file()
 
+    @property
+    def rows(self):
+        """Data baris (list of list). Tidak tersedia jika lazy=True, gunakan iter_rows()."""
+        if self.lazy:
+            raise ValueError("Data tidak dimuat karena lazy=True, gunakan iter_rows()")
+        return self._rows
+
+    @rows.setter
+    def rows(self, value):
+        self._rows = value
+        # Index lama menunjuk ke list sebelumnya; cukup buang milik instance ini
+        # (_derive juga lewat sini, jadi index CSVFile asal tidak boleh ikut dibuang)
+        self._indexes = {}
+
     # ---------- Utility ----------
     def _auto_cast(self, value: str):
-        if value is None:
-            return None
-        v = value.strip()
-        if v == "":
-            return ""
-        # Int
-        if v.isdigit() or (v.startswith("-") and v[1:].isdigit()):
-            try:
-                return int(v)
-            except Exception:
-                pass
-        # Float
-        try:
-            return float(v)
-        except ValueError:
-            pass
-        # Bool
-        lower_v = v.lower()
-        if lower_v in ("true", "false"):
-            return lower_v == "true"
-        return v
+        return _cast_value(value)
 
     def _normalize_header(self, headers):
-        return [h.strip().lower().replace(" ", "_").replace("-", "_") for h in headers]
+        return [h.strip().lower().translate(_HEADER_TRANS) for h in headers]
 
-    def _detect_encoding(self, encodings=("utf-8", "utf-8-sig", "latin-1")):
+    def _detect_encoding(self, encodings=_ENCODINGS):
+        """
+        Deteksi encoding dari sampel awal file (bukan seluruh file).
+        Return (encoding, sample_lines) untuk dipakai deteksi delimiter.
+        """
+        with open(self.path, "rb") as f:
+            sample = f.read(_SNIFF_BYTES)
+            at_eof = not f.read(1)
         for enc in encodings:
             try:
-                with open(self.path, "r", encoding=enc) as f:
-                    content = f.read().splitlines()
-                return enc, content
+                # Decoder incremental agar karakter multibyte yang terpotong di akhir sampel tidak dianggap error
+                text = codecs.getincrementaldecoder(enc)().decode(sample, final=at_eof)
             except UnicodeDecodeError:
                 continue
+            lines = text.splitlines()
+            if not at_eof and lines:
+                lines.pop()  # Baris terakhir mungkin terpotong
+            return enc, lines
         raise UnicodeDecodeError("CSVFile", self.path, 0, 0, "Tidak bisa decode file dengan encoding fallback")
 
     def _detect_delimiter(self, sample_lines):
+        """
+        Pilih delimiter yang jumlah field per record-nya paling konsisten.
+        Semua kandidat dihitung dalam satu scan sampel: karakter delimiter dihitung
+        di luar tanda kutip (bagian genap hasil split '"'), record yang berlanjut
+        ke baris berikutnya (kutip belum ditutup) digabung.
+        """
+        candidates = [d for d in self.candidates if isinstance(d, str) and len(d) == 1 and d != '"']
+        tallies = {delim: {} for delim in candidates}  # {delim: {jumlah_field: frekuensi}}
+        fields = dict.fromkeys(candidates, 1)  # Jumlah field record yang sedang dibaca
+        in_quotes = False
+        for line in sample_lines[:_SNIFF_LINES]:
+            if not line and not in_quotes:
+                continue  # Baris kosong tidak dihitung
+            parts = line.split('"')
+            outside = parts[1::2] if in_quotes else parts[::2]
+            for delim in candidates:
+                fields[delim] += sum(part.count(delim) for part in outside)
+            if len(parts) % 2 == 0:
+                in_quotes = not in_quotes  # Jumlah kutip ganjil
+            if in_quotes:
+                continue  # Record berlanjut ke baris berikutnya
+            for delim in candidates:
+                tally = tallies[delim]
+                tally[fields[delim]] = tally.get(fields[delim], 0) + 1
+                fields[delim] = 1
+
         scores = {}
-        for delim in self.candidates:
-            try:
-                reader = csv.reader(sample_lines, delimiter=delim, quotechar='"')
-                lengths = [len(row) for row in reader if row]
-                if not lengths:
-                    continue
-                common_len, freq = Counter(lengths).most_common(1)[0]
-                scores[delim] = freq
-            except Exception:
-                continue
+        for delim, tally in tallies.items():
+            if tally:
+                # Modus jumlah field; delimiter yang tidak muncul (1 field) kalah dari yang memecah baris
+                freq, n_fields = max((freq, n_fields) for n_fields, freq in tally.items())
+                scores[delim] = (n_fields > 1, freq)
         return max(scores, key=scores.get) if scores else ","
 
     # ---------- Load file ----------
-    def _load_file(self):
-        self.encoding, file_content = self._detect_encoding()
-        self.delimiter = self._detect_delimiter(file_content)
+    def _records(self, f):
+        """Reader baris mentah dari file, melewati baris kosong jika skip_empty"""
+        reader = csv.reader(f, delimiter=self.delimiter, quotechar='"')
+        if not self.skip_empty:
+            return reader
+        return (row for row in reader if any(cell.strip() for cell in row))
+
+    def _fallback_encodings(self):
+        """Encoding fallback setelah self.encoding, dipakai jika ada byte tidak valid setelah sampel deteksi"""
+        if self.encoding not in _ENCODINGS:
+            return []
+        return list(_ENCODINGS[_ENCODINGS.index(self.encoding) + 1:])
+
+    def _validate_encoding(self):
+        """
+        Pastikan seluruh file bisa di-decode dengan self.encoding tanpa memuat isinya
+        (decode per blok _SNIFF_BYTES); jika gagal, pindah ke encoding fallback berikutnya.
+        Dipakai mode lazy agar iter_rows() tidak gagal di tengah stream.
+        """
+        fallbacks = self._fallback_encodings()
+        while True:
+            decoder = codecs.getincrementaldecoder(self.encoding)()
+            try:
+                with open(self.path, "rb") as f:
+                    for block in iter(lambda: f.read(_SNIFF_BYTES), b""):
+                        decoder.decode(block)
+                    decoder.decode(b"", final=True)
+                return
+            except UnicodeDecodeError:
+                if not fallbacks:
+                    raise
+                self.encoding = fallbacks.pop(0)
 
-        with open(self.path, "r", encoding=self.encoding) as f:
-            reader = csv.reader(f, delimiter=self.delimiter, quotechar='"')
-            rows = [row for row in reader if (not self.skip_empty or any(cell.strip() for cell in row))]
+    def _read_rows(self, limit=None):
+        """
+        Parse file dalam satu pass: pisahkan header, lewati baris kosong, dan cast sekaligus.
+        Return (header, rows); header None jika has_header=False atau file kosong.
+        Jika ada byte tidak valid setelah sampel deteksi, ulangi dengan encoding fallback berikutnya.
+        """
+        # Cast sekali per nilai unik: kolom CSV biasanya banyak nilai berulang,
+        # dan hasil cast (int/float/bool/str) immutable sehingga aman dipakai ulang
+        cast = lru_cache(maxsize=None)(_cast_value) if self.auto_cast else None
+        fallbacks = self._fallback_encodings()
+        while True:
+            try:
+                with open(self.path, "r", encoding=self.encoding) as f:
+                    records = self._records(f)
+                    header = next(records, None) if self.has_header else None
+                    records = islice(records, limit)
+                    rows = [list(map(cast, row)) for row in records] if cast else list(records)
+                    return header, rows
+            except UnicodeDecodeError:
+                if not fallbacks:
+                    raise
+                self.encoding = fallbacks.pop(0)
 
-        if self.has_header and rows:
-            self.header, self.rows = rows[0], rows[1:]
-            if self.normalize_header:
-                self.header = self._normalize_header(self.header)
-            if self.auto_cast:
-                self.rows = [[self._auto_cast(v) for v in row] for row in self.rows]
-        else:
-            self.rows = [[self._auto_cast(v) for v in row] for row in rows] if self.auto_cast else rows
+    def _load_file(self):
+        self.encoding, sample_lines = self._detect_encoding()
+        self.delimiter = self._detect_delimiter(sample_lines)
+        if self.lazy:
+            # Hanya header yang dibaca; data dibaca lewat iter_rows(), jadi encoding
+            # harus valid untuk seluruh file, bukan hanya sampel
+            self._validate_encoding()
+        header, self.rows = self._read_rows(limit=0 if self.lazy else None)
+        if header is not None:
+            self.header = self._normalize_header(header) if self.normalize_header else header
+
+    def _mark_modified(self):
+        """Tandai data berubah: hash index di CSVFile ini dan yang berbagi baris jadi tidak valid"""
+        self._data_version[0] += 1
+        self._indexes.clear()
 
     def _get_expected_columns_count(self):
         """Mendapatkan jumlah kolom yang diharapkan"""
         if self.has_header:
             return len(self.header)
-        elif self.rows:
-            return len(self.rows[0])
+        elif self._rows:
+            return len(self._rows[0])
         else:
             return 0
 
@@ -117,20 +277,134 @@ class CSVFile:
             # Sudah pas
             return data
 
+    def _header_positions(self):
+        """
+        Cache {nama_header: index} agar lookup kolom tidak scan header setiap kali.
+        Dibangun ulang jika isi self.header berubah (diganti atau diubah langsung).
+        """
+        if self._header_idx_src != self.header:
+            positions = {}
+            for i, name in enumerate(self.header):
+                positions.setdefault(name, i)  # Header duplikat: pakai yang pertama, sama seperti list.index
+            self._header_idx = positions
+            self._header_idx_src = list(self.header)  # Snapshot isi, bukan referensi
+        return self._header_idx
+
     def _get_column_index(self, col_identifier):
         """Mendapatkan index kolom dari identifier (string nama header atau int index)"""
         if isinstance(col_identifier, str):
             if not self.has_header:
                 raise ValueError("Tidak bisa menggunakan nama header karena CSV tidak punya header")
-            if col_identifier not in self.header:
+            positions = self._header_positions()
+            if col_identifier not in positions:
                 raise KeyError(f"Header '{col_identifier}' tidak ditemukan")
-            return self.header.index(col_identifier)
+            return positions[col_identifier]
         elif isinstance(col_identifier, int):
             return col_identifier
         else:
             raise TypeError("col_identifier harus string (nama header) atau int (index kolom)")
 
+    def get_column(self, col_identifier, default=None):
+        """
+        Mendapatkan semua nilai dari satu kolom sebagai list.
+        
+        Args:
+            col_identifier: Nama header (str) atau index kolom (int)
+            default: Nilai untuk baris yang lebih pendek dari index kolom
+        
+        Returns:
+            list: Nilai kolom, urut sesuai rows
+        """
+        col_index = self._get_column_index(col_identifier)
+        return [row[col_index] if col_index < len(row) else default for row in self.rows]
+
+    def ensure_index(self, col_identifier, rebuild=False):
+        """
+        Bangun hash index untuk satu kolom agar filter_by_column dengan operator
+        "==" dan "in" tidak perlu scan semua baris.
+        
+        Index tidak dipakai lagi setelah data diubah lewat method CSVFile (update_*, add_row,
+        delete_row, add/insert_column), termasuk lewat hasil filter yang berbagi objek baris
+        dengan CSVFile ini, dan saat rows diganti (csv.rows = [...]). Jika isi list rows
+        diubah langsung (mis. csv.rows[0][1] = ... atau csv.rows.append(...)), panggil lagi
+        dengan rebuild=True.
+        
+        Args:
+            col_identifier: Nama header (str) atau index kolom (int)
+            rebuild: Bangun ulang walaupun index sudah ada
+        """
+        col_index = self._get_column_index(col_identifier)
+        if not rebuild and self._valid_index(col_index) is not None:
+            return
+        index = {}
+        for i, row in enumerate(self.rows):
+            if col_index < len(row):
+                cell_value = row[col_index]
+                if cell_value == cell_value:  # NaN tidak pernah "==", jangan diindex
+                    index.setdefault(cell_value, []).append(i)
+        self._indexes[col_index] = (self._data_version[0], index)
+
+    def _valid_index(self, col_index):
+        """Return hash index kolom jika ada dan data belum berubah sejak dibangun, selain itu None"""
+        entry = self._indexes.get(col_index)
+        if entry is None or entry[0] != self._data_version[0]:
+            return None
+        return entry[1]
+
+    def _lookup_index(self, col_index, value, operator):
+        """Return list index baris dari hash index, atau None jika harus scan biasa"""
+        index = self._valid_index(col_index)
+        if index is None:
+            return None
+        try:
+            if operator == "==":
+                if value != value:  # NaN: hasil scan selalu kosong, jangan cocokkan lewat identitas
+                    return None
+                return index.get(value, [])
+            if operator == "in" and isinstance(value, (list, tuple, set, frozenset)):
+                row_ids = set()
+                for v in value:
+                    if v != v:
+                        return None
+                    row_ids.update(index.get(v, ()))
+                return sorted(row_ids)
+        except (TypeError, ValueError):
+            # Nilai tidak hashable atau tidak bisa dibandingkan, fallback ke scan
+            pass
+        return None
+
     # ---------- Helper Methods for Looping ----------
+    def iter_rows(self, chunk_size=8192):
+        """
+        Baca data langsung dari file per chunk tanpa memuat semua baris ke memori.
+        Cocok dipakai dengan lazy=True untuk file besar.
+        
+        Args:
+            chunk_size: Jumlah baris per chunk
+        
+        Returns:
+            generator: Yang menghasilkan list of rows (maksimal chunk_size baris)
+        
+        Example:
+            csv_file = CSVFile("big.csv", lazy=True)
+            for chunk in csv_file.iter_rows(chunk_size=1000):
+                for row in chunk:
+                    print(row)
+        """
+        cast = lru_cache(maxsize=_STREAM_CAST_CACHE)(_cast_value) if self.auto_cast else None
+        with open(self.path, "r", encoding=self.encoding) as f:
+            records = self._records(f)
+            if self.has_header:
+                next(records, None)  # Header sudah dibaca saat load
+            chunk = []
+            for row in records:
+                chunk.append(list(map(cast, row)) if cast else row)
+                if len(chunk) >= chunk_size:
+                    yield chunk
+                    chunk = []
+            if chunk:
+                yield chunk
+
     def enumerate_rows(self):
         """
         Return enumerate object untuk looping dengan index dan row.
@@ -192,37 +466,52 @@ class CSVFile:
             
             csv_file.update_rows(custom_update)
         """
+        self._mark_modified()
         for index, row in enumerate(self.rows):
             new_row = update_function(index, row)
             if new_row is not None:
                 self.rows[index] = new_row
 
     # ---------- Filter Methods ----------
-    def filter_rows(self, condition: Callable[[list, int], bool]) -> 'CSVFile':
+    def filter_rows(self, condition: Callable[[list, int], bool], parallel=False, workers=None) -> 'CSVFile':
         """
         Filter baris berdasarkan fungsi condition.
         Fungsi condition menerima parameter (row, index) dan return boolean.
         
         Args:
             condition: Fungsi yang menerima (row, index) dan return True/False
+            parallel: Jika True, evaluasi condition per potongan baris di thread pool.
+                      Berguna jika condition melepas GIL (mis. operasi NumPy/IO);
+                      condition harus thread-safe.
+            workers: Jumlah thread (default: os.cpu_count())
         
         Returns:
-            CSVFile baru dengan baris yang memenuhi kondisi
+            CSVFile baru dengan baris yang memenuhi kondisi (urutan tetap)
         """
-        filtered_rows = [row for i, row in enumerate(self.rows) if condition(row, i)]
+        if not parallel:
+            filtered_rows = [row for i, row in enumerate(self.rows) if condition(row, i)]
+            return self._derive(filtered_rows)
+        
+        workers = workers or os.cpu_count() or 1
+        chunk_size = max(1, -(-len(self.rows) // workers))  # Pembulatan ke atas
         
-        filtered_csv = CSVFile.__new__(CSVFile)
-        filtered_csv.path = self.path
-        filtered_csv.candidates = self.candidates
-        filtered_csv.has_header = self.has_header
-        filtered_csv.skip_empty = self.skip_empty
-        filtered_csv.auto_cast = self.auto_cast
-        filtered_csv.normalize_header = self.normalize_header
-        filtered_csv.encoding = self.encoding
-        filtered_csv.delimiter = self.delimiter
-        filtered_csv.header = self.header[:]
-        filtered_csv.rows = filtered_rows
+        def filter_chunk(base):
+            chunk = self.rows[base:base + chunk_size]
+            return [row for i, row in enumerate(chunk, base) if condition(row, i)]
         
+        # Potongan berurutan, hasil digabung sesuai urutan submit
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(filter_chunk, range(0, len(self.rows), chunk_size))
+            filtered_rows = [row for chunk in results for row in chunk]
+        return self._derive(filtered_rows)
+
+    def _derive(self, rows):
+        """
+        Buat CSVFile baru dengan konfigurasi yang sama tetapi rows yang berbeda.
+        Header dipakai bersama (tidak dicopy); method yang mengubah header membuat list baru.
+        """
+        filtered_csv = copy.copy(self)
+        filtered_csv.rows = rows  # Setter rows juga mengosongkan _indexes milik salinan
         return filtered_csv
 
     def filter_by_column(self, col_identifier, value: Any, operator: str = "==") -> 'CSVFile':
@@ -237,40 +526,21 @@ class CSVFile:
         Returns:
             CSVFile baru dengan baris yang memenuhi kondisi
         """
-        col_index = self._get_column_index(col_identifier)
+        compare = _resolve_operator(operator)  # Di-resolve sekali, bukan per baris
         
-        def condition(row, index):
-            if col_index >= len(row):
-                return False
-            
-            cell_value = row[col_index]
-            
-            if operator == "==":
-                return cell_value == value
-            elif operator == "!=":
-                return cell_value != value
-            elif operator == ">":
-                return cell_value > value
-            elif operator == "<":
-                return cell_value < value
-            elif operator == ">=":
-                return cell_value >= value
-            elif operator == "<=":
-                return cell_value <= value
-            elif operator == "in":
-                return cell_value in value
-            elif operator == "not in":
-                return cell_value not in value
-            elif operator == "contains":
-                return value in str(cell_value)
-            elif operator == "startswith":
-                return str(cell_value).startswith(str(value))
-            elif operator == "endswith":
-                return str(cell_value).endswith(str(value))
-            else:
-                raise ValueError(f"Operator '{operator}' tidak didukung")
-        
-        return self.filter_rows(condition)
+        col_index = self._get_column_index(col_identifier)
+        if self._indexes:
+            row_ids = self._lookup_index(col_index, value, operator)
+            if row_ids is not None:
+                return self._derive([self.rows[i] for i in row_ids])
+        
+        rows = self.rows
+        if not rows or min(map(len, rows)) > col_index:
+            # Semua baris punya kolom ini: ambil sel, bandingkan, dan pilih baris dalam satu pass di C
+            mask = map(compare, map(itemgetter(col_index), rows), repeat(value))
+        else:
+            mask = [col_index < len(row) and compare(row[col_index], value) for row in rows]
+        return self._derive(list(compress(rows, mask)))
 
     def filter_empty(self, col_identifier=None) -> 'CSVFile':
         """
@@ -308,49 +578,24 @@ class CSVFile:
         Returns:
             CSVFile baru dengan baris yang memenuhi semua kondisi
         """
+        # Compile semua kondisi sekali menjadi tuple (col_index, compare, value).
+        # Kondisi callable ditandai col_index None dan dipanggil dengan (row, index).
+        compiled = []
+        for cond in conditions:
+            if callable(cond):
+                compiled.append((None, cond, None))
+            else:
+                col_id, value, operator = cond
+                compiled.append((self._get_column_index(col_id), _resolve_operator(operator), value))
+        compiled = tuple(compiled)
+
         def combined_condition(row, index):
-            for cond in conditions:
-                if callable(cond):
-                    # Condition adalah fungsi
-                    if not cond(row, index):
+            for col_index, compare, value in compiled:
+                if col_index is None:
+                    if not compare(row, index):
                         return False
-                else:
-                    # Condition adalah tuple (col_identifier, value, operator)
-                    col_id, value, operator = cond
-                    col_index = self._get_column_index(col_id)
-                    
-                    if col_index >= len(row):
-                        return False
-                    
-                    cell_value = row[col_index]
-                    
-                    if operator == "==":
-                        if cell_value != value:
-                            return False
-                    elif operator == "!=":
-                        if cell_value == value:
-                            return False
-                    elif operator == ">":
-                        if not (cell_value > value):
-                            return False
-                    elif operator == "<":
-                        if not (cell_value < value):
-                            return False
-                    elif operator == ">=":
-                        if not (cell_value >= value):
-                            return False
-                    elif operator == "<=":
-                        if not (cell_value <= value):
-                            return False
-                    elif operator == "in":
-                        if cell_value not in value:
-                            return False
-                    elif operator == "not in":
-                        if cell_value in value:
-                            return False
-                    elif operator == "contains":
-                        if value not in str(cell_value):
-                            return False
+                elif col_index >= len(row) or not compare(row[col_index], value):
+                    return False
             return True
         
         return self.filter_rows(combined_condition)
@@ -381,6 +626,7 @@ class CSVFile:
             raise IndexError(f"Index baris {index} tidak valid. Jumlah baris: {len(self.rows)}")
 
         expected_columns = self._get_expected_columns_count()
+        self._mark_modified()
         
         if self.has_header and isinstance(new_data, dict):
             # Cek jika dict berisi key int (index kolom) atau string (nama header)
@@ -407,10 +653,10 @@ class CSVFile:
             else:
                 # Update berdasarkan nama header
                 updated_row = self.rows[index][:]
+                positions = self._header_positions()
                 for col_name, value in new_data.items():
-                    if col_name in self.header:
-                        col_index = self.header.index(col_name)
-                        updated_row[col_index] = value
+                    if col_name in positions:
+                        updated_row[positions[col_name]] = value
                     else:
                         # Jika header tidak ditemukan, abaikan atau tambahkan kolom baru?
                         print(f"Peringatan: Header '{col_name}' tidak ditemukan, diabaikan")
@@ -432,11 +678,7 @@ class CSVFile:
             raise IndexError("Index baris tidak valid")
         
         if isinstance(col_identifier, str):
-            if not self.has_header:
-                raise ValueError("Tidak bisa menggunakan nama header karena CSV tidak punya header")
-            if col_identifier not in self.header:
-                raise KeyError(f"Header '{col_identifier}' tidak ditemukan")
-            col_index = self.header.index(col_identifier)
+            col_index = self._get_column_index(col_identifier)
         elif isinstance(col_identifier, int):
             col_index = col_identifier
             expected_columns = self._get_expected_columns_count()
@@ -448,6 +690,7 @@ class CSVFile:
         else:
             raise TypeError("col_identifier harus string (nama header) atau int (index kolom)")
         
+        self._mark_modified()
         self.rows[row_index][col_index] = value
 
     def save(self, path=None):
@@ -458,22 +701,40 @@ class CSVFile:
         """
         save_path = path or self.path
         
-        # Pastikan semua row memiliki jumlah kolom yang konsisten
+        # Pastikan semua row memiliki jumlah kolom yang konsisten, sekaligus convert ke string
+        # jika auto_cast (karena auto_cast mengubah tipe data). Tanpa auto_cast, sel yang bukan
+        # string (hasil update) cukup diserahkan ke csv.writer, yang menulis str(cell) dan None -> "".
+        # Rows berupa generator agar ditulis per baris tanpa membuat salinan seluruh data.
         expected_columns = self._get_expected_columns_count()
-        adjusted_rows = [self._adjust_columns(row, expected_columns) for row in self.rows]
-        
-        # Prepare data untuk disimpan
-        if self.has_header:
-            data_to_save = [self.header] + adjusted_rows
+        if self.auto_cast:
+            header = _row_to_strs(self.header, len(self.header))
+            rows = (_row_to_strs(row, expected_columns) for row in self.rows)
         else:
-            data_to_save = adjusted_rows
-        
-        # Convert data ke string jika diperlukan (karena auto_cast mungkin mengubah tipe data)
-        data_to_save = [[str(cell) if cell is not None else "" for cell in row] for row in data_to_save]
-        
-        with open(save_path, "w", encoding=self.encoding, newline='') as f:
-            writer = csv.writer(f, delimiter=self.delimiter, quotechar='"', quoting=csv.QUOTE_MINIMAL)
-            writer.writerows(data_to_save)
+            header = self.header
+            rows = (self._adjust_columns(row, expected_columns) for row in self.rows)
+        
+        # Tulis ke file sementara di direktori yang sama, lalu ganti file tujuan hanya jika
+        # semua baris berhasil ditulis; jika ada error, file asli tetap utuh
+        save_dir = os.path.dirname(os.path.abspath(save_path))
+        tmp = tempfile.NamedTemporaryFile("w", encoding=self.encoding, newline='', dir=save_dir,
+                                          prefix=".csvfile-", suffix=".tmp", delete=False)
+        try:
+            with tmp as f:
+                writer = csv.writer(f, delimiter=self.delimiter, quotechar='"', quoting=csv.QUOTE_MINIMAL)
+                if self.has_header:
+                    writer.writerow(header)
+                writer.writerows(rows)
+            if os.path.exists(save_path):
+                shutil.copymode(save_path, tmp.name)  # Pertahankan permission file lama
+            else:
+                # File baru: permission default seperti open() (0666 dikurangi umask), bukan 0600 dari tempfile
+                umask = os.umask(0)
+                os.umask(umask)
+                os.chmod(tmp.name, 0o666 & ~umask)
+            os.replace(tmp.name, save_path)
+        except BaseException:
+            os.unlink(tmp.name)
+            raise
         
         print(f"Data berhasil disimpan ke: {save_path}")
 
@@ -487,17 +748,19 @@ class CSVFile:
             column_name: Nama header untuk kolom baru (jika ada header)
             default_value: Nilai default jika column_data tidak provided
         """
-        if column_data and len(column_data) != len(self.rows):
+        rows = self.rows  # Ambil dulu agar instance lazy gagal sebelum header diubah
+        if column_data and len(column_data) != len(rows):
             raise ValueError("Panjang column_data harus sama dengan jumlah rows")
         
         # Tambah ke header jika ada
         if self.has_header and column_name:
             if self.normalize_header:
-                column_name = column_name.strip().lower().replace(" ", "_").replace("-", "_")
-            self.header.append(column_name)
+                column_name = column_name.strip().lower().translate(_HEADER_TRANS)
+            self.header = self.header + [column_name]  # List baru, header bisa dipakai bersama hasil filter
         
+        self._mark_modified()
         # Tambah kolom ke setiap row
-        for i, row in enumerate(self.rows):
+        for i, row in enumerate(rows):
             if column_data:
                 # Gunakan nilai dari column_data
                 new_value = column_data[i]
@@ -518,7 +781,8 @@ class CSVFile:
             column_name: Nama header untuk kolom baru
             default_value: Nilai default jika column_data tidak provided
         """
-        if column_data and len(column_data) != len(self.rows):
+        rows = self.rows  # Ambil dulu agar instance lazy gagal sebelum header diubah
+        if column_data and len(column_data) != len(rows):
             raise ValueError("Panjang column_data harus sama dengan jumlah rows")
         
         expected_columns = self._get_expected_columns_count()
@@ -528,11 +792,12 @@ class CSVFile:
         # Sisipkan ke header jika ada
         if self.has_header and column_name:
             if self.normalize_header:
-                column_name = column_name.strip().lower().replace(" ", "_").replace("-", "_")
-            self.header.insert(position, column_name)
+                column_name = column_name.strip().lower().translate(_HEADER_TRANS)
+            self.header = self.header[:position] + [column_name] + self.header[position:]
         
+        self._mark_modified()
         # Sisipkan kolom ke setiap row
-        for i, row in enumerate(self.rows):
+        for i, row in enumerate(rows):
             if column_data:
                 new_value = column_data[i]
             else:
@@ -563,6 +828,7 @@ class CSVFile:
         - new_data bisa dict (berdasarkan nama header/index) atau list (berdasarkan urutan kolom)
         """
         expected_columns = self._get_expected_columns_count()
+        self._mark_modified()
         
         if self.has_header and isinstance(new_data, dict):
             # Cek tipe key
@@ -608,6 +874,7 @@ class CSVFile:
         """
         if 0 <= index < len(self.rows):
             del self.rows[index]
+            self._mark_modified()
         else:
             raise IndexError("Index baris tidak valid")
 
@@ -623,4 +890,5 @@ class CSVFile:
         return self._get_expected_columns_count()
 
     def __repr__(self):
-        return f"<CSVFile path={self.path}, rows={len(self.rows)}, columns={self._get_expected_columns_count()}, delimiter='{self.delimiter}'>"
+        rows = "lazy" if self.lazy else len(self._rows)
+        return f"<CSVFile path={self.path}, rows={rows}, columns={self._get_expected_columns_count()}, delimiter='{self.delimiter}'>"